@@ -1,7 +1,14 @@
 """DaisyFT: Fast Tailwind Components"""
 from .utils.config import ProjectConfig, BinaryMetadata, ComponentMetadata
 from .utils.variants import ComponentVariant, variant
-from .registry.components import *  # This will register all components
 
 __all__ = ['ProjectConfig', 'BinaryMetadata', 'ComponentMetadata', 'ComponentVariant', 'variant']
 __version__ = "0.1.0"
+
+def __getattr__(name: str):
+    # Components (and fasthtml) load on first use; the Registry imports them on lookup
+    from .registry import components
+    try:
+        return getattr(components, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -1,13 +1,15 @@
+from __future__ import annotations
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-import questionary
-from pathlib import Path
-from typing import Optional, Type
-from ..registry.base import RegistryBase
-from ..registry.decorators import Registry
-from ..utils.config import ProjectConfig
-from ..utils.console import console
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
+from ..utils.console import console, spinner
+
+if TYPE_CHECKING:
+    from ..registry.base import InstallPlan, RegistryBase
+    from ..utils.config import ProjectConfig
+
+# Dependencies with this prefix are Python packages; anything else is a registry name
+PIP_PREFIX = "pip:"
 
 def add(
     component: Optional[str] = typer.Argument(None, help="Component or block to add"),
@@ -15,13 +17,14 @@ def add(
     verbose: bool = typer.Option(True, "--verbose/--brief", help="Include detailed documentation")
 ) -> None:
     """Add a component or block to your project"""
+    from ..utils.config import ProjectConfig
     
     # Ensure we're in a project
-    if not Path("daisyft.conf.py").exists():
-        console.print("[red]Error:[/red] Not in a daisyft project. Run 'daisyft init' first.")
-        raise typer.Exit(1)
+    config = ProjectConfig.load_or_exit()
     
-    config = ProjectConfig.load()
+    # Registry and component modules are only needed once we're in a project
+    from ..registry.base import InstallPlan
+    from ..registry.decorators import Registry
     
     # Get component selection
     component_name = component or _select_component_interactively()
@@ -34,45 +37,59 @@ def add(
     if not component_class:
         console.print(f"[red]Error:[/red] Component '{component_name}' not found")
         raise typer.Exit(1)
+    meta = component_class._registry_meta
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with spinner(refresh_per_second=10, transient=True) as progress:
         task = progress.add_task("Installing component...", total=100)
         
         try:
-            # Install dependencies first
-            if component_class._registry_meta.dependencies:
+            # Plan dependencies first
+            plan = InstallPlan()
+            if meta.dependencies:
                 progress.update(task, description="Checking dependencies...")
-                _install_dependencies(component_class, config, force, verbose)
-            progress.update(task, advance=30)
-            
-            # Install the component
-            progress.update(task, description="Installing component files...")
-            if _should_install(component_class, config, force):
-                component_class.install(config, force=True, verbose=verbose)
-                
-                # Track in config
-                _track_component(component_class, config)
+                classes = _dependency_closure(component_class)
+                plan.merge(_install_dependencies(classes, config, force, verbose))
                 
+                packages = _missing_packages(component_class, classes)
+                if packages:
+                    progress.update(task, description="Installing Python packages...")
+                    _install_packages(packages)
+            
+            # Plan the component and track it in config
+            progress.update(task, advance=30, description="Installing component files...")
+            install = _should_install(component_class, config, force)
+            if install:
+                plan.merge(component_class.plan_install(config, verbose=verbose))
+                _track_component(component_class, config, plan)
+            
+            # Write all files and save config in one pass
+            plan.commit(config)
+            
+            if install:
                 # Sync project
                 progress.update(task, description="Syncing project...")
                 from .sync import sync_with_config
                 sync_with_config(config, force)
                 
             progress.update(task, advance=70)
-            console.print(f"[green]✓[/green] Added {component_name} successfully!")
-            console.print("\nTo use this component, add the following import:")
-            console.print(f"[bold]from components.ui.{component_name} import {component_name.title()}[/bold]")
             
         except Exception as e:
             console.print(f"[red]Error:[/red] {str(e)}")
             raise typer.Exit(1)
+    
+    # One write for the whole summary, after the live display is gone
+    console.print(
+        f"[green]✓[/green] Added {meta.name} successfully!\n"
+        "\nTo use this component, add the following import:\n"
+        f"[bold]from components.ui.{meta.name} import {component_class.__name__}[/bold]",
+        soft_wrap=True
+    )
 
 def _select_component_interactively() -> Optional[str]:
     """Handle interactive component selection"""
+    import questionary
+    from ..registry.decorators import Registry
+    
     component_type = questionary.select(
         "What would you like to add?",
         choices=["UI Component", "Block"]
@@ -81,16 +98,15 @@ def _select_component_interactively() -> Optional[str]:
     if not component_type:
         return None
         
-    choices = (Registry.get_available_components() 
+    choices = (Registry.get_component_choices() 
               if component_type == "UI Component" 
-              else Registry.get_available_blocks())
+              else Registry.get_block_choices())
     
-    selected = questionary.select(
+    # Choice values are registry names, so no parsing of the label is needed
+    return questionary.select(
         f"Select a {'component' if component_type == 'UI Component' else 'block'}:",
-        choices=choices
+        choices=[questionary.Choice(title=label, value=name) for label, name in choices]
     ).ask()
-    
-    return selected.split(":", 1)[0].strip().lower() if selected else None
 
 def _should_install(component_class, config: ProjectConfig, force: bool) -> bool:
     """Check if component should be installed"""
@@ -99,23 +115,76 @@ def _should_install(component_class, config: ProjectConfig, force: bool) -> bool
         return typer.confirm(f"{name} is already installed. Overwrite?")
     return True
 
-def _install_dependencies(component_class, config: ProjectConfig, force: bool, verbose: bool) -> None:
-    """Install component dependencies"""
-    deps = component_class._registry_meta.dependencies
-    if not deps:
-        return
+def _dependency_closure(component_class) -> Dict[str, Type[RegistryBase]]:
+    """Resolve the transitive registry dependencies of a component"""
+    from ..registry.decorators import Registry
+    
+    # Seeding with the component itself keeps a dependency cycle from re-adding it
+    visited = {component_class._registry_meta.name}
+    classes: Dict[str, Type[RegistryBase]] = {}
+    queue = deque(component_class._registry_meta.dependencies)
+    
+    while queue:
+        name = queue.popleft()
+        if name in visited:
+            continue
+        visited.add(name)
+        if name.startswith(PIP_PREFIX):
+            continue
+        dep_class = Registry.get_component(name)
+        if not dep_class:
+            raise ValueError(f"Unknown dependency '{name}' (Python packages need a '{PIP_PREFIX}' prefix)")
+        classes[name] = dep_class
+        queue.extend(dep_class._registry_meta.dependencies)
         
-    for dep in deps:
-        if not config.has_component(dep):
-            dep_class = Registry.get_component(dep)
-            if dep_class and _should_install(dep_class, config, force):
-                dep_class.install(config, force=True, verbose=verbose)
+    return classes
+
+def _missing_packages(component_class, classes: Dict[str, Type[RegistryBase]]) -> List[str]:
+    """Collect the pip: dependencies that aren't installed yet"""
+    from ..utils.package import PackageManager
+    
+    packages = {}  # Ordered set
+    for cls in (component_class, *classes.values()):
+        for dep in cls._registry_meta.dependencies:
+            if dep.startswith(PIP_PREFIX):
+                packages[dep[len(PIP_PREFIX):]] = None
+    return PackageManager.missing(packages)
+
+def _install_packages(packages: List[str]) -> None:
+    """Install Python packages with one package manager call"""
+    from ..utils.package import PackageManager
+    
+    try:
+        PackageManager.install(packages)
+    except Exception as e:
+        detail = (getattr(e, "stderr", None) or str(e)).strip()
+        console.print(f"[yellow]Warning:[/yellow] Could not install {', '.join(packages)}: {detail}")
+        console.print("You can install them manually later with your package manager of choice.")
+
+def _install_dependencies(
+    classes: Dict[str, Type[RegistryBase]],
+    config: ProjectConfig,
+    force: bool,
+    verbose: bool
+) -> InstallPlan:
+    """Plan every dependency that isn't installed yet
+    
+    Planning only renders, so order doesn't matter; the caller commits once.
+    """
+    from ..registry.base import InstallPlan
+    
+    installed = config.installed_names
+    plan = InstallPlan()
+    for name, dep_class in classes.items():
+        if name not in installed and _should_install(dep_class, config, force):
+            plan.merge(dep_class.plan_install(config, verbose=verbose))
+    return plan
 
-def _track_component(component_class, config: ProjectConfig) -> None:
+def _track_component(component_class, config: ProjectConfig, plan: InstallPlan) -> None:
     """Track component in project config"""
     meta = component_class._registry_meta
-    component_path = config.paths["ui"] / f"{meta.name}.py"
-    config.add_component(
+    component_path = config.component_path(meta.name)
+    plan.track(
         name=meta.name,
         type=meta.type,
         path=component_path
@@ -1,6 +1,8 @@
 import typer
 from pathlib import Path
 import subprocess
+import os
+import sys
 from rich.console import Console
 from ..utils.config import ProjectConfig
 from ..utils.console import console  
@@ -8,24 +10,33 @@ from ..utils.console import console
 def build(
     input_path: str = typer.Option(None, "--input", "-i", help="Input CSS file path"),
     output_path: str = typer.Option(None, "--output", "-o", help="Output CSS file path"),
-    minify: bool = typer.Option(False, "--minify", "-m", help="Minify output CSS")
+    minify: bool = typer.Option(False, "--minify", "-m", help="Minify output CSS"),
+    exec_: bool = typer.Option(False, "--exec", help="Replace this process with Tailwind (no status output after build)")
 ) -> None:
     """Build Tailwind CSS"""
-    config = ProjectConfig.load(Path("daisyft.conf.py"))
+    config = ProjectConfig.load()
     
-    input_css = Path(input_path) if input_path else Path(config.paths["css"]) / "input.css"
-    output_css = Path(output_path) if output_path else Path(config.paths["css"]) / "output.css"
+    input_css = Path(input_path) if input_path else config.input_css_path
+    output_css = Path(output_path) if output_path else config.output_css_path
     
     console.print(f"[bold]Building CSS...[/bold]")
     try:
         cmd = [
-            "./tailwindcss",
+            str(config.tailwind_binary),
             "-i", str(input_css),
             "-o", str(output_css)
         ]
         if minify:
             cmd.append("--minify")
         
+        # Nothing runs after the build, so hand the process over to Tailwind
+        if exec_ and os.name != 'nt':
+            sys.stdout.flush()
+            try:
+                os.execv(cmd[0], cmd)
+            except OSError:
+                pass  # Fall back to running it as a child
+        
         subprocess.run(cmd, check=True)
         console.print(f"[green]✓[/green] CSS built successfully!")
     except subprocess.CalledProcessError as e:
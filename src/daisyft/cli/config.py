@@ -3,9 +3,6 @@ import typer
 from daisyft.utils.config import ProjectConfig
 from daisyft.utils.console import console
 
-app = typer.Typer()
-
-@app.command()
 def config(
     verbose: bool = typer.Option(
         None, 
@@ -17,6 +14,7 @@ def config(
     config = ProjectConfig.load()
     
     if verbose is not None:
-        config.verbose = verbose
-        config.save()
+        if verbose != config.verbose:
+            config.verbose = verbose
+            config.save()
         console.print(f"Documentation verbosity set to: [green]{'verbose' if verbose else 'brief'}[/green]")
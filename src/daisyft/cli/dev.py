@@ -1,12 +1,9 @@
 import typer
 from pathlib import Path
-import subprocess
-import os
 import sys
-import time
 from rich.console import Console
 from ..utils.config import ProjectConfig
-from ..utils.process import ProcessManager
+from ..utils.process import ProcessManager, wait_for_file, wait_for_port
 from ..utils.console import console
 
 def dev(
@@ -16,14 +13,14 @@ def dev(
     output_css: str = typer.Option(None, "--output", "-o", help="Output CSS file path"),
 ) -> None:
     """Start development server with CSS watching"""
-    config = ProjectConfig.load(Path("daisyft.conf.py"))
+    config = ProjectConfig.load()
     
     # Use config values unless overridden by command line
     host = host or config.host
     port = port or config.port
     
-    input_css_path = Path(input_css) if input_css else Path(config.paths["css"]) / "input.css"
-    output_css_path = Path(output_css) if output_css else Path(config.paths["css"]) / "output.css"
+    input_css_path = Path(input_css) if input_css else config.input_css_path
+    output_css_path = Path(output_css) if output_css else config.output_css_path
     
     # Delete existing output.css if it exists
     if output_css_path.exists():
@@ -33,37 +30,37 @@ def dev(
     pm = ProcessManager()
     
     # Start Tailwind CSS watcher with process group
-    creationflags = subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
-    preexec_fn = os.setsid if os.name != 'nt' else None
-    
-    css_process = subprocess.Popen([
-        "./tailwindcss",
+    css_process = pm.spawn([
+        str(config.tailwind_binary),
         "-i", str(input_css_path),
         "-o", str(output_css_path),
         "--watch"
-    ], preexec_fn=preexec_fn, creationflags=creationflags)
-    pm.add_process(css_process)
+    ])
     
-    # Brief pause to let Tailwind start
-    time.sleep(0.5)
+    # Wait for Tailwind's first build instead of a fixed pause
+    wait_for_file(output_css_path, css_process)
     
     # Start FastHTML dev server with process group
-    server_process = subprocess.Popen([
+    server_process = pm.spawn([
         "uvicorn",
         f"{config.app_path.stem}:app",
         "--host", host,
         "--port", str(port),
         "--reload"
-    ], preexec_fn=preexec_fn, creationflags=creationflags)
-    pm.add_process(server_process)
+    ])
     
-    # Brief pause to check if server started successfully
-    time.sleep(0.5)
-    if server_process.poll() is None:
+    # Report once the server accepts connections
+    if wait_for_port(host, port, server_process):
         console.print(f"\n[green]Server running at[/green] http://{host}:{port}")
     
     try:
-        server_process.wait()
+        # Either process exiting ends the session, so a dead watcher isn't missed
+        exited = pm.wait_any()
     except KeyboardInterrupt:
         pm.cleanup()
-        sys.exit(0) 
\ No newline at end of file
+        sys.exit(0)
+    
+    pm.cleanup()
+    if exited is css_process:
+        console.print(f"[red]Error:[/red] Tailwind watcher exited with code {exited.returncode}")
+        raise typer.Exit(1) 
\ No newline at end of file
@@ -1,36 +1,100 @@
 from dataclasses import dataclass
 from pathlib import Path
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-import questionary
-from typing import Optional
-import subprocess
-import requests
+from typing import Optional, Tuple
+import os
 import stat
-from platform import system
-from questionary import Choice
-from ..utils.console import console 
+import hashlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from ..utils.console import console, spinner
 from ..utils.config import ProjectConfig, TailwindReleaseInfo
 from ..utils.templates import render_template
-from ..utils.package import PackageManager
-from ..registry.decorators import Registry, RegistryType
+from ..utils.cache import read_json_cache, write_json_cache
 
+IS_WINDOWS = sys.platform == "win32"
+
+@lru_cache(maxsize=1)
+def _http_session():
+    """Pooled HTTP session shared by the GitHub API and binary downloads"""
+    import requests
+    
+    session = requests.Session()
+    session.headers["User-Agent"] = "daisyft"
+    return session
+
+# How long a fetched GitHub release stays fresh
+RELEASE_CACHE_TTL = 3600
+
+@lru_cache(maxsize=4)
 def get_release_info(style: str = "daisy") -> dict:
-    """Get latest release info from GitHub"""
+    """Get latest release info from GitHub, cached on disk for an hour
+    
+    Once the hour is up the cached copy is revalidated with its ETag, so an
+    unchanged release costs a 304 instead of a full download.
+    """
+    cache_name = f"release-{style}.json"
+    cached = read_json_cache(cache_name)
+    if not isinstance(cached, dict) or "body" not in cached:
+        cached = None
+    elif time.time() - cached.get("fetched", 0) < RELEASE_CACHE_TTL:
+        return cached["body"]
+    
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    
     url = TailwindReleaseInfo.get_api_url(style)
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
+    response = _http_session().get(url, headers=headers)
+    if cached and response.status_code == 304:
+        info = cached["body"]
+    else:
+        response.raise_for_status()
+        info = response.json()
+        cached = None
+    write_json_cache(cache_name, {
+        "etag": response.headers.get("ETag") or (cached or {}).get("etag"),
+        "last_modified": response.headers.get("Last-Modified") or (cached or {}).get("last_modified"),
+        "fetched": time.time(),
+        "body": info,
+    })
+    return info
+
+def _release_asset(release_info: Optional[dict], asset_name: str) -> dict:
+    """A release's entry for one asset, or {} if it isn't listed"""
+    for asset in (release_info or {}).get("assets", []):
+        if asset.get("name") == asset_name:
+            return asset
+    return {}
+
+def _asset_sha256(asset: dict) -> Optional[str]:
+    """SHA-256 GitHub publishes for a release asset, if any"""
+    digest = asset.get("digest") or ""
+    return digest[len("sha256:"):] if digest.startswith("sha256:") else None
 
 def download_tailwind_binary(config: ProjectConfig, force: bool = False) -> Path:
     """Download the appropriate Tailwind binary"""
-    binary_path = Path("tailwindcss" + (".exe" if system().lower() == "windows" else ""))
+    needed, release_info = check_tailwind_binary(config, force=force)
+    if not needed:
+        return config.tailwind_binary
+    return fetch_tailwind_binary(config, release_info)
+
+def check_tailwind_binary(config: ProjectConfig, force: bool = False) -> Tuple[bool, Optional[dict]]:
+    """Decide whether the Tailwind binary needs downloading, with the release info
+    
+    May ask before replacing an existing binary, so call it from the main thread.
+    """
+    binary_exists = config.tailwind_binary.exists()
+    release_info = None
     
     try:
         release_info = get_release_info(config.style)
         
-        if binary_path.exists() and not force and config.binary_metadata:
+        if binary_exists and not force and config.binary_metadata:
             # Check if we need to update
             if config.binary_metadata.style == config.style:
                 current_version = config.binary_metadata.version
@@ -38,48 +102,83 @@ def download_tailwind_binary(config: ProjectConfig, force: bool = False) -> Path
                 
                 if current_version == latest_version:
                     console.print(f"[green]✓[/green] Tailwind binary is up to date ({current_version})")
-                    return binary_path
+                    return False, release_info
                 
                 if not typer.confirm(
                     f"\nNew version available: {latest_version} (current: {current_version})\nDownload update?",
                     default=True
                 ):
-                    return binary_path
+                    return False, release_info
             else:
                 if not typer.confirm(
                     f"\nExisting binary is for {config.binary_metadata.style} style, "
                     f"but {config.style} style is requested. Download new version?",
                     default=True
                 ):
-                    return binary_path
+                    return False, release_info
     except Exception as e:
         console.print(f"[yellow]Warning:[/yellow] Could not check for updates: {e}")
-        if binary_path.exists() and not force:
-            return binary_path
+        if binary_exists and not force:
+            return False, release_info
     
-    base_url = TailwindReleaseInfo.get_download_url(config.style)
-    url = f"{base_url}{config.tailwind_binary_name}"
-    response = requests.get(url, stream=True)
+    return True, release_info
+
+def fetch_tailwind_binary(config: ProjectConfig, release_info: Optional[dict] = None) -> Path:
+    """Download the Tailwind binary, verified against release_info when given
+    
+    Never prompts, so it is safe to run in a worker thread.
+    """
+    binary_path = config.tailwind_binary
+    
+    # Fetch the exact asset release_info describes, so its digest and tag match
+    # even if a newer "latest" release has landed since the info was cached
+    asset = _release_asset(release_info, config.tailwind_binary_name)
+    url = asset.get("browser_download_url") or (
+        f"{TailwindReleaseInfo.get_download_url(config.style)}{config.tailwind_binary_name}"
+    )
+    response = _http_session().get(url, stream=True)
     response.raise_for_status()
     
-    # Download to original name first
+    # Download to original name first, streaming so the binary never sits in memory
     temp_path = Path(config.tailwind_binary_name)
-    temp_path.write_bytes(response.content)
-    
-    # Rename to tailwindcss
-    if binary_path.exists():
-        binary_path.unlink()
-    temp_path.rename(binary_path)
+    expected_sha256 = _asset_sha256(asset)
+    digest = hashlib.sha256()
+    with open(temp_path, "wb") as f:
+        for chunk in response.iter_content(chunk_size=1 << 20):
+            digest.update(chunk)
+            f.write(chunk)
+        
+        if expected_sha256 and digest.hexdigest() != expected_sha256:
+            f.close()
+            temp_path.unlink()
+            raise RuntimeError(f"Checksum mismatch for {config.tailwind_binary_name}")
+        
+        # Make binary executable (skip on Windows)
+        if not IS_WINDOWS:
+            os.fchmod(f.fileno(), os.fstat(f.fileno()).st_mode | stat.S_IEXEC)
     
-    # Make binary executable (skip on Windows)
-    if system().lower() != "windows":
-        binary_path.chmod(binary_path.stat().st_mode | stat.S_IEXEC)
+    # Atomically swap in as tailwindcss
+    os.replace(temp_path, binary_path)
     
     # Update config with new binary metadata
-    config.update_binary_metadata(release_info)
+    if release_info:
+        config.update_binary_metadata(release_info)
     
     return binary_path
 
+# (value, description) pairs for the style and theme prompts
+STYLE_CHOICES = (
+    ("daisy", "Use DaisyUI components (recommended)"),
+    ("vanilla", "Use vanilla Tailwind CSS"),
+)
+THEME_CHOICES = (
+    ("dark", "Dark mode (default)"),
+    ("light", "Light mode"),
+    ("cupcake", "Light and playful"),
+    ("corporate", "Professional and clean"),
+    # ... other themes with descriptions ...
+)
+
 @dataclass
 class InitOptions:
     """Initialization options for project setup"""
@@ -91,10 +190,17 @@ class InitOptions:
     static_dir: Path = Path("static")
     verbose: bool = True
 
+def _is_interactive() -> bool:
+    """Whether there is a terminal to prompt on"""
+    return sys.stdin.isatty()
+
 def get_user_options(defaults: bool = False) -> InitOptions:
     """Get project options either from user input or defaults"""
     if defaults:
         return InitOptions()
+    if not _is_interactive():
+        console.print("[dim]No terminal detected, using default settings[/dim]")
+        return InitOptions()
     
     default_options = {
         "style": ("daisy", "Choose between DaisyUI components or vanilla Tailwind"),
@@ -113,6 +219,13 @@ def get_user_options(defaults: bool = False) -> InitOptions:
             console.print(f"  [green]{key}:[/green] {value}")
             console.print(f"    [dim]{desc}[/dim]")
     
+    if typer.confirm("\nUse these defaults?", default=True):
+        return InitOptions()
+    
+    # prompt_toolkit is heavy, so only load it when customizing
+    import questionary
+    from questionary import Choice
+    
     console.print("\n[dim]Use arrow keys to move, space to select options to customize[/dim]")
     
     # Start with defaults
@@ -130,60 +243,39 @@ def get_user_options(defaults: bool = False) -> InitOptions:
         ]
     ).ask()
     
-    # Only prompt for selected options
-    if "style" in to_change:
-        answers["style"] = questionary.select(
-            "Style:",
-            choices=[
-                Choice("daisy", "Use DaisyUI components (recommended)"),
-                Choice("vanilla", "Use vanilla Tailwind CSS")
-            ],
-            default="daisy"
-        ).ask()
-    
-    if "theme" in to_change:
-        theme_question = questionary.select(
-            "Theme:",
-            choices=[
-                Choice("dark", "Dark mode (default)"),
-                Choice("light", "Light mode"),
-                Choice("cupcake", "Light and playful"),
-                Choice("corporate", "Professional and clean"),
-                # ... other themes with descriptions ...
-            ],
-            default="dark"
-        ).skip_if(lambda x: answers["style"] != "daisy", default="dark")
-        answers["theme"] = theme_question.ask()
-    
-    if "app_path" in to_change:
-        answers["app_path"] = questionary.text(
-            "FastHTML app entry point:",
-            default="main.py"
-        ).ask()
-    
-    if "include_icons" in to_change:
-        answers["include_icons"] = questionary.confirm(
-            "Include ft-icons package?",
-            default=True
-        ).ask()
-    
-    if "components_dir" in to_change:
-        answers["components_dir"] = questionary.text(
-            "Components directory:",
-            default="components"
-        ).ask()
-    
-    if "static_dir" in to_change:
-        answers["static_dir"] = questionary.text(
-            "Static assets directory:",
-            default="static"
-        ).ask()
-    
-    if "verbose" in to_change:
-        answers["verbose"] = questionary.confirm(
-            "Include detailed documentation in component files?",
-            default=True
-        ).ask()
+    # Only prompt for selected options, asked in one questionary session
+    questions = [
+        {
+            "type": "select",
+            "name": "style",
+            "message": "Style:",
+            "choices": [Choice(f"{value}: {desc}", value) for value, desc in STYLE_CHOICES],
+            "default": "daisy",
+        },
+        {
+            "type": "select",
+            "name": "theme",
+            "message": "Theme:",
+            "choices": [Choice(f"{value}: {desc}", value) for value, desc in THEME_CHOICES],
+            "default": "dark",
+            # Themes only apply to DaisyUI
+            "when": lambda a: a.get("style", answers["style"]) == "daisy",
+        },
+        {"type": "text", "name": "app_path", "message": "FastHTML app entry point:", "default": "main.py"},
+        {"type": "confirm", "name": "include_icons", "message": "Include ft-icons package?", "default": True},
+        {"type": "text", "name": "components_dir", "message": "Components directory:", "default": "components"},
+        {"type": "text", "name": "static_dir", "message": "Static assets directory:", "default": "static"},
+        {
+            "type": "confirm",
+            "name": "verbose",
+            "message": "Include detailed documentation in component files?",
+            "default": True,
+        },
+    ]
+    selected = to_change or []
+    questions = [q for q in questions if q["name"] in selected]
+    if questions:
+        answers.update(questionary.prompt(questions))
     
     return InitOptions(
         style=answers["style"],
@@ -224,48 +316,55 @@ def init(
             "static": options.static_dir,
             "css": options.static_dir / "css",
             "js": options.static_dir / "js",
-            "icons": "icons",
+            "icons": Path("icons"),
         })
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    # Re-running init may ask about replacing the binary; settle that here,
+    # before the spinner starts, so the worker thread never prompts
+    needs_binary, release_info = check_tailwind_binary(config, force=force)
+    
+    install_icons = config.include_icons and not config_exists
+    with spinner() as progress, ThreadPoolExecutor(max_workers=2) as executor:
         task = progress.add_task("", total=100)
         
+        # Network work runs in the background while project files are written
+        download = executor.submit(fetch_tailwind_binary, config, release_info) if needs_binary else None
+        if install_icons:
+            from ..utils.package import PackageManager
+            icons = executor.submit(
+                PackageManager.install,
+                "git+https://github.com/banditburai/ft-icon.git",
+                manager=package_manager
+            )
+        
         # Create project structure
         if not config_exists:
             progress.update(task, description="Creating project structure...")
-            for path in config.paths.values():
-                (project_path / path).mkdir(parents=True, exist_ok=True)
+            config.ensure_directories(project_path)
             
-            # Generate initial files
-            render_template(
-                "input.css.jinja2",
-                project_path / config.paths["css"] / "input.css",
-                style=config.style,
-                components={}  # Add empty components dict for initial setup
-            )
-                        
-            # Generate main app
-            render_template(
-                "main.py.jinja2",
-                project_path / config.app_path,
-                style=config.style,
-                theme=config.theme,
-                paths=config.paths,
-                port=config.port,
-                live=config.live,
-                host=config.host
+            # Generate initial files and the main app from one shared context
+            base_context = {"style": config.style}
+            renders = (
+                # Empty components dict for initial setup
+                ("input.css.jinja2", config.input_css_path, {"components": {}}),
+                ("main.py.jinja2", config.app_path, {
+                    "theme": config.theme,
+                    "paths": config.paths,
+                    "port": config.port,
+                    "live": config.live,
+                    "host": config.host,
+                }),
             )
+            for template_name, output_path, context in renders:
+                render_template(template_name, project_path / output_path, **base_context, **context)
             
             progress.update(task, advance=50)
         
         # Always check/update Tailwind binary
         progress.update(task, description="Checking Tailwind binary...")
         try:
-            download_tailwind_binary(config, force=force)
+            if download is not None:
+                download.result()
             progress.update(task, advance=25)
         except Exception as e:
             console.print(f"[yellow]Warning:[/yellow] Could not download Tailwind binary: {e}")
@@ -274,13 +373,10 @@ def init(
         config.save(project_path / "daisyft.conf.py")
         
         # Install ft-icons if requested
-        if config.include_icons and not config_exists:
+        if install_icons:
             progress.update(task, description="Installing ft-icons...")
             try:
-                PackageManager.install(
-                    "git+https://github.com/banditburai/ft-icon.git",
-                    manager=package_manager
-                )
+                icons.result()
             except Exception as e:
                 console.print(f"[yellow]Warning:[/yellow] Could not install ft-icons: {e}")
                 console.print("You can install it manually later with your package manager of choice.")
@@ -1,29 +1,57 @@
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
 from pathlib import Path
+from importlib import import_module
 from typing import Optional, List
-from daisyft.cli import init, add, config, build, dev, run, sync
-from .registry import commands as registry_commands
+import click
 from ..utils.console import console
 
+# Subcommands are imported only when invoked (or listed by --help)
+LAZY_COMMANDS = {
+    "init": "daisyft.cli.init:init",
+    "add": "daisyft.cli.add:add",
+    "build": "daisyft.cli.build:build",
+    "dev": "daisyft.cli.dev:dev",
+    "run": "daisyft.cli.run:run",
+    "sync": "daisyft.cli.sync:sync",
+    "config": "daisyft.cli.config:config",
+}
+
+# Sub-apps (command groups), resolved the same way
+LAZY_GROUPS = {
+    "registry": "daisyft.cli.registry.commands:registry_app",
+}
+
+def _resolve(target: str):
+    module_name, attr = target.split(":")
+    return getattr(import_module(module_name), attr)
+
+def load_command(name: str):
+    """Import and return the function behind a lazy subcommand"""
+    return _resolve(LAZY_COMMANDS[name])
+
+class LazyGroup(TyperGroup):
+    """Typer group that resolves LAZY_COMMANDS on first use"""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return [*LAZY_COMMANDS, *LAZY_GROUPS, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in LAZY_COMMANDS:
+            sub = typer.Typer()
+            sub.command(name=cmd_name)(load_command(cmd_name))
+            return typer.main.get_command(sub)
+        if cmd_name in LAZY_GROUPS:
+            return typer.main.get_group(_resolve(LAZY_GROUPS[cmd_name]))
+        return super().get_command(ctx, cmd_name)
+
 app = typer.Typer(
     name="daisyft",
     help="DaisyUI/Tailwind/Motion components for FastHTML",
-    no_args_is_help=True
+    no_args_is_help=True,
+    cls=LazyGroup
 )
 
-# Register commands
-app.command()(init.init)
-app.command()(add.add)
-app.command()(build.build)
-app.command()(dev.dev)
-app.command()(run.run)
-app.command()(sync.sync)
-app.command()(config.config)
-
-# Add registry commands as a group
-app.add_typer(registry_commands.registry_app, name="registry")
-
 @app.callback()
 def callback(ctx: typer.Context):
     """
@@ -40,23 +68,22 @@ def callback(ctx: typer.Context):
             "[yellow]No daisyft configuration found.[/yellow] Would you like to initialize a new project?",
             default=True
         ):
-            ctx.invoke(init.init)
+            ctx.invoke(load_command("init"))
             raise typer.Exit()
         else:
             console.print("[red]Error:[/red] daisyft requires configuration to run. Use 'daisyft init' to set up a new project.")
             raise typer.Exit(1)
     
     try:
-        # Try to load config to validate it
-        from importlib.util import spec_from_file_location, module_from_spec
-        spec = spec_from_file_location("daisyft_conf", "daisyft.conf.py")
-        config_module = module_from_spec(spec)
-        spec.loader.exec_module(config_module)
+        # Loading validates the config; the parse is memoized, so the
+        # subcommand's own ProjectConfig.load() reuses it
+        from ..utils.config import ProjectConfig
+        ProjectConfig.load()
     except Exception as e:
         console.print(f"[red]Error:[/red] Invalid daisyft.conf.py configuration: {e}")
         if typer.confirm("Would you like to reinitialize the project?", default=False):
-            ctx.invoke(init.init)
+            ctx.invoke(load_command("init"))
         raise typer.Exit(1)
 
 if __name__ == "__main__":
-    app() 
\ No newline at end of file
+    app() 
@@ -3,20 +3,58 @@ from pathlib import Path
 import subprocess
 import os
 import sys
-import time
+import hashlib
 from rich.console import Console
 from ..utils.config import ProjectConfig
-from ..utils.process import ProcessManager
+from ..utils.process import ProcessManager, wait_for_port
 from ..utils.console import console
 
+# Directories that never hold Tailwind sources
+_SKIP_DIRS = {"__pycache__", "node_modules", "venv", "env", "site-packages", "build", "dist"}
+
+def _is_source_dir(root: str, name: str) -> bool:
+    """Whether a directory may hold Tailwind sources (not hidden, cached or a virtualenv)"""
+    if name.startswith(".") or name in _SKIP_DIRS:
+        return False
+    return not os.path.exists(os.path.join(root, name, "pyvenv.cfg"))
+
+def _css_stamp(output_css_path: Path, *extra: str) -> str:
+    """Fingerprint every file Tailwind could read, by path, size and mtime
+    
+    Walks the project from the current directory, skipping hidden dirs,
+    virtualenvs, build artifacts and the build output itself.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in extra:
+        digest.update(part.encode())
+    output = os.path.abspath(output_css_path)
+    for root, dirs, files in os.walk("."):
+        dirs[:] = sorted(d for d in dirs if _is_source_dir(root, d))
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            if name.startswith(".") or os.path.abspath(path) == output:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue  # Dangling symlink, or removed mid-walk
+            digest.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+def _output_signature(output_css_path: Path) -> str:
+    """Size and mtime of the built CSS, so a rewrite by dev or build is noticed"""
+    st = os.stat(output_css_path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
 def run(
     host: str = typer.Option(None, "--host", "-h", help="Override host from config"),
     port: int = typer.Option(None, "--port", "-p", help="Override port from config"),
     input_css: str = typer.Option(None, "--input", "-i", help="Input CSS file path"),
     output_css: str = typer.Option(None, "--output", "-o", help="Output CSS file path"),
+    exec_: bool = typer.Option(False, "--exec", help="Replace this process with the app server after building CSS"),
 ) -> None:
     """Build CSS and run the FastHTML application"""
-    config = ProjectConfig.load(Path("daisyft.conf.py"))
+    config = ProjectConfig.load()
     
     # Use config values unless overridden by command line
     host = host or config.host
@@ -24,48 +62,67 @@ def run(
     
     pm = ProcessManager()
 
-    input_css_path = Path(input_css) if input_css else Path(config.paths["css"]) / "input.css"
-    output_css_path = Path(output_css) if output_css else Path(config.paths["css"]) / "output.css"
-    
-    # Delete existing output.css if it exists
-    if output_css_path.exists():
-        output_css_path.unlink()
-        console.print("[bold]Cleaning existing CSS...[/bold]")
-    
-    # Build CSS first
-    console.print("[bold]Building CSS...[/bold]")
-    try:
-        subprocess.run([
-            "./tailwindcss",
-            "-i", str(input_css_path),
-            "-o", str(output_css_path),
-            "--minify"
-        ], check=True)
-        console.print("[green]✓[/green] CSS built successfully!")
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]Error:[/red] Failed to build CSS: {e}")
-        raise typer.Exit(1)
+    input_css_path = Path(input_css) if input_css else config.input_css_path
+    output_css_path = Path(output_css) if output_css else config.output_css_path
     
-    # Start FastHTML server with process group
-    creationflags = subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
-    preexec_fn = os.setsid if os.name != 'nt' else None
-    
-    server_process = subprocess.Popen([
+    css_cmd = [
+        str(config.tailwind_binary),
+        "-i", str(input_css_path),
+        "-o", str(output_css_path),
+        "--minify"
+    ]
+    server_args = [
         sys.executable,
         str(config.app_path),
         "--host", host,
         "--port", str(port)
-    ], preexec_fn=preexec_fn, creationflags=creationflags)
+    ]
+    exec_server = exec_ and os.name != 'nt'
+    
+    # Skip the build when nothing Tailwind reads has changed since the last one,
+    # and the output is still the file that build produced
+    stamp_path = output_css_path.with_name(f".{output_css_path.name}.stamp")
+    stamp = _css_stamp(output_css_path, *css_cmd)
+    try:
+        css_current = stamp_path.read_text() == f"{stamp} {_output_signature(output_css_path)}"
+    except OSError:
+        css_current = False
+    
+    if css_current:
+        console.print("[green]✓[/green] CSS up to date")
+        server_process = None if exec_server else pm.spawn(server_args)
+    else:
+        # Delete existing output.css if it exists
+        if output_css_path.exists():
+            output_css_path.unlink()
+            console.print("[bold]Cleaning existing CSS...[/bold]")
+        
+        # Build CSS, starting the server alongside so its startup overlaps the build
+        console.print("[bold]Building CSS...[/bold]")
+        css_process = subprocess.Popen(css_cmd)
+        server_process = None if exec_server else pm.spawn(server_args)
+        if css_process.wait() != 0:
+            console.print(f"[red]Error:[/red] Failed to build CSS: Tailwind exited with code {css_process.returncode}")
+            pm.cleanup()
+            raise typer.Exit(1)
+        console.print("[green]✓[/green] CSS built successfully!")
+        stamp_path.write_text(f"{stamp} {_output_signature(output_css_path)}")
     
-    pm.add_process(server_process)
+    # Nothing is left to supervise, so let the server take over this process
+    if exec_server:
+        console.print(f"\n[green]Starting server at[/green] http://{host}:{port}")
+        sys.stdout.flush()
+        try:
+            os.execv(server_args[0], server_args)
+        except OSError:
+            server_process = pm.spawn(server_args)  # Fall back to running it as a child
     
-    # Brief pause to check if server started successfully
-    time.sleep(0.5)
-    if server_process.poll() is None:
+    # Report once the server accepts connections
+    if wait_for_port(host, port, server_process):
         console.print(f"\n[green]Server running at[/green] http://{host}:{port}")
     
     try:
         server_process.wait()
     except KeyboardInterrupt:
         pm.cleanup()
-        sys.exit(0) 
\ No newline at end of file
+        sys.exit(0)
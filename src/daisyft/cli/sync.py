@@ -6,29 +6,31 @@ from ..utils.config import ProjectConfig
 import logging
 from ..utils.console import console
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+TAILWIND_INPUT_CSS = b"@tailwind base;\n@tailwind components;\n@tailwind utilities;\n"
 
 def sync_with_config(config: ProjectConfig, force: bool = False) -> None:
     """Internal sync function that works with ProjectConfig object"""
     logger.debug("Starting sync...")
     
-    # Ensure directories exist
-    for path in config.paths.values():
-        path = Path(path)  # Ensure Path object
-        path.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Ensured directory exists: {path}")
+    # Ensure directories exist (leaves only; parents come along)
+    for path in config.ensure_directories():
+        logger.debug("Ensured directory exists: %s", path)
 
     # Update CSS
-    css_file = Path(config.paths["css"]) / "input.css"
-    logger.debug(f"CSS file path: {css_file}")
+    css_file = config.input_css_path
+    logger.debug("CSS file path: %s", css_file)
+    
+    try:
+        current = css_file.read_bytes()
+    except FileNotFoundError:
+        current = None
     
-    if not css_file.exists() or force:
+    # Leave an identical file alone so Tailwind's watcher isn't retriggered
+    if (current is None or force) and current != TAILWIND_INPUT_CSS:
         logger.debug("Creating/updating CSS file")
-        css_content = [
-            "@tailwind base;",
-            "@tailwind components;",
-            "@tailwind utilities;"
-        ]
-        css_file.write_text("\n".join(css_content) + "\n")
+        css_file.write_bytes(TAILWIND_INPUT_CSS)
     
     logger.debug("Sync completed successfully")
     return True
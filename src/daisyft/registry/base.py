@@ -1,11 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, ClassVar, Type
+from typing import Dict, List, Optional, ClassVar, Type
 from pathlib import Path
-from ..utils.config import ProjectConfig
+from ..utils.config import ProjectConfig, ComponentMetadata
+from ..utils.templates import get_component_env
+import ast
 import inspect
-import jinja2
+from jinja2 import TemplateNotFound
 import os
 import textwrap
 
@@ -57,7 +59,7 @@ class RegistryType(str, Enum):
     def is_content(self) -> bool:
         return self in {self.PAGE, self.FILE}
 
-@dataclass
+@dataclass(slots=True)
 class RegistryMeta:
     """Metadata for registry items"""
     name: str
@@ -71,9 +73,46 @@ class RegistryMeta:
     tailwind: Optional[dict] = None
     detailed_docs: Optional[str] = None  # New field for detailed documentation
 
+@dataclass
+class InstallPlan:
+    """Pending file writes and config entries, flushed together by commit()"""
+    py_writes: Dict[Path, str] = field(default_factory=dict)
+    config_entries: List[ComponentMetadata] = field(default_factory=list)
+
+    def merge(self, other: InstallPlan) -> None:
+        """Fold another plan into this one"""
+        self.py_writes.update(other.py_writes)
+        self.config_entries.extend(other.config_entries)
+
+    def track(self, name: str, type: str, path: Path) -> None:
+        """Record a component to add to the project config"""
+        self.config_entries.append(ComponentMetadata(name=name, type=type, path=path))
+
+    def commit(self, config: ProjectConfig) -> None:
+        """Write every planned file once, then save the config once"""
+        for directory in {path.parent for path in self.py_writes}:
+            directory.mkdir(parents=True, exist_ok=True)
+        for path, content in self.py_writes.items():
+            # Rewriting identical content would only bump the mtime, which
+            # invalidates run's CSS stamp and wakes Tailwind's watcher
+            try:
+                if path.read_text() == content:
+                    continue
+            except FileNotFoundError:
+                pass
+            path.write_text(content)
+        
+        for entry in self.config_entries:
+            config.add_component(entry.name, entry.type, entry.path, save=False)
+        if self.config_entries:
+            config.save()
+
 class RegistryBase:
     """Base class for registry components"""
+    __slots__ = ()  # Let slotted components drop the per-instance __dict__
     _registry_meta: ClassVar[RegistryMeta]
+    _class_body: ClassVar[str]
+    _variants_source: ClassVar[str]
 
     @classmethod
     def get_install_path(cls, config: ProjectConfig) -> Path:
@@ -83,7 +122,7 @@ class RegistryBase:
             return (config.paths["components"] / meta.name 
                    if len(meta.files) > 1 
                    else config.paths["components"])
-        return config.paths["ui"]
+        return config.ui_dir
 
     @classmethod
     def get_template_path(cls) -> Path:
@@ -96,41 +135,63 @@ class RegistryBase:
         raise FileNotFoundError("Component template not found")
 
     @classmethod
-    def install(cls, config: ProjectConfig, force: bool = False, verbose: bool = True) -> bool:
-        """Install this component into the project"""
-        meta = cls._registry_meta
-        target_dir = Path(cls.get_install_path(config))
-        target_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Get template
-        template_path = cls.get_template_path()
-        template = jinja2.Template(template_path.read_text())
+    def _extract_source(cls) -> None:
+        """Split the defining module into class body and variants section
         
-        # Extract component parts
-        module = inspect.getmodule(cls)
-        module_source = inspect.getsource(module)
-        class_source = inspect.getsource(cls)
-        
-        # Get class body (skip decorator and get actual class content)
-        class_lines = class_source.split('\n')
-        in_class = False
-        class_body_lines = []
+        The module is read and parsed once; both parts are stored on the class.
+        """
+        module_source = inspect.getsource(inspect.getmodule(cls))
+        lines = module_source.splitlines()
+        node = next(
+            node for node in ast.parse(module_source).body
+            if isinstance(node, ast.ClassDef) and node.name == cls.__name__
+        )
         
-        for line in class_lines:
-            if line.strip().startswith('class '):
-                in_class = True
-                continue
-            if in_class and not line.strip().startswith('@'):
-                class_body_lines.append(line)
+        # Body starts at the first statement (or its decorators), keeping any
+        # comments above it
+        first = node.body[0]
+        start = min(d.lineno for d in getattr(first, "decorator_list", None) or [first]) - 1
+        while start - 1 > node.lineno - 1 and lines[start - 1].lstrip().startswith("#"):
+            start -= 1
+        cls._class_body = textwrap.dedent("\n".join(lines[start:node.end_lineno]) + "\n")
         
-        # Dedent the class body before passing to template
-        class_body = textwrap.dedent('\n'.join(class_body_lines))
-        
-        # Get variants section if it exists
         variants_marker = f"""# ============================================================================
 #  {cls.__name__} Variants
 # ============================================================================"""
-        variants_source = module_source.split(variants_marker)[1].strip() if variants_marker in module_source else ""
+        cls._variants_source = (
+            module_source.split(variants_marker)[1].strip()
+            if variants_marker in module_source else ""
+        )
+
+    @classmethod
+    def get_class_body(cls) -> str:
+        """Get the dedented class body source, parsed once per class"""
+        if "_class_body" not in cls.__dict__:
+            cls._extract_source()
+        return cls._class_body
+
+    @classmethod
+    def get_variants_source(cls) -> str:
+        """Get the module's variants section, read once per class"""
+        if "_variants_source" not in cls.__dict__:
+            cls._extract_source()
+        return cls._variants_source
+
+    @classmethod
+    def plan_install(cls, config: ProjectConfig, verbose: bool = True) -> InstallPlan:
+        """Render this component's files without writing them"""
+        meta = cls._registry_meta
+        target_dir = Path(cls.get_install_path(config))
+        
+        # Get template (compiled once per process, bytecode cached across runs)
+        try:
+            template = get_component_env().get_template("component.py.jinja2")
+        except TemplateNotFound:
+            raise FileNotFoundError("Component template not found") from None
+        
+        # Extract component parts
+        class_body = cls.get_class_body()
+        variants_source = cls.get_variants_source()
         
         # Prepare template context
         context = {
@@ -138,16 +199,19 @@ class RegistryBase:
             'verbose': verbose,
             'imports': meta.imports,
             'class_name': cls.__name__,
+            'slots': '__slots__' in cls.__dict__,
             'class_body': class_body,
             'variants_source': variants_source,
             'docs': meta.detailed_docs if verbose else None
         }
         
         # Render template
-        content = template.render(**context)
-        
-        # Write file
-        target_path = target_dir / f"{meta.name}.py"
-        target_path.write_text(content)
-        
-        return True 
\ No newline at end of file
+        plan = InstallPlan()
+        plan.py_writes[target_dir / f"{meta.name}.py"] = template.render(**context)
+        return plan
+
+    @classmethod
+    def install(cls, config: ProjectConfig, force: bool = False, verbose: bool = True) -> bool:
+        """Install this component into the project"""
+        cls.plan_install(config, verbose=verbose).commit(config)
+        return True
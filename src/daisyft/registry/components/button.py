@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Union, List, Any, Dict
+from functools import lru_cache
+import sys
+from typing import Union, List, Any, Dict, Optional
 from fasthtml.common import Button as FastButton, Span
 from ..decorators import Registry
 from daisyft.utils.variants import ComponentVariant, variant
@@ -34,17 +36,19 @@ Adding Variants:
     name="button",
     description="A versatile button component with multiple variants and states",
     categories=["ui"],
-    dependencies=["python-fasthtml"],
+    dependencies=["pip:python-fasthtml"],
     files=["button.py"],
     imports=[
         "from dataclasses import dataclass",
+        "from functools import lru_cache",
+        "import sys",
         "from typing import Union, List, Any, Optional, Callable, Dict",        
         "from fasthtml.common import Button as FastButton, Span",
     ],
     detailed_docs=DOCS
 )
 
-@dataclass
+@dataclass(slots=True)
 class Button(RegistryBase):
     """A button component that supports DaisyUI classes and custom variants."""
     content: Union[str, List[Any], None]
@@ -53,33 +57,43 @@ class Button(RegistryBase):
     disabled: bool = False
     loading: bool = False
 
-    def get_classes(self) -> str:
+    def get_classes(self, variant_config: Optional[ComponentVariant] = None) -> str:
         """Generate the complete class string."""
-        variant_config = BUTTON_VARIANTS.get(self.var, ButtonVariant(""))
-        
-        classes = []
-        if variant_config.daisy:
-            classes.append("btn")
-        if variant_config.classes:
-            classes.append(variant_config.classes)
-        if self.cls:
-            classes.append(self.cls)
-        if self.disabled:
-            classes.append("btn-disabled" if variant_config.daisy else "opacity-50 cursor-not-allowed")
-        if self.loading:
-            classes.append("loading" if variant_config.daisy else "")
-            
-        return " ".join(filter(None, classes))
+        if not (self.var or self.cls or self.disabled or self.loading):
+            return "btn"  # Plain Button("...") is the common case
+        if variant_config is None:
+            variant_config = BUTTON_VARIANTS.get(self.var, _EMPTY_VARIANT)
+        return self._build_classes(
+            variant_config.classes, variant_config.daisy, self.cls, self.disabled, self.loading
+        )
 
-    def prepare_content(self) -> List[Any]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_classes(variant_classes: str, daisy: bool, cls: str, disabled: bool, loading: bool) -> str:
+        """Join the class string, memoized on the resolved variant and state."""
+        parts = (
+            "btn" if daisy else "",
+            variant_classes,
+            cls,
+            ("btn-disabled" if daisy else "opacity-50 cursor-not-allowed") if disabled else "",
+            "loading" if loading and daisy else "",
+        )
+        # Identical buttons share one string object
+        return sys.intern(" ".join(p for p in parts if p))
+
+    def prepare_content(self, variant_config: Optional[ComponentVariant] = None) -> List[Any]:
         """Prepare button content including loading state and wrappers."""
-        variant_config = BUTTON_VARIANTS.get(self.var, ButtonVariant(""))
+        if variant_config is None:
+            variant_config = BUTTON_VARIANTS.get(self.var, _EMPTY_VARIANT)
         
         content = []
         if self.loading:
             content.append(Span(cls="loading loading-spinner"))
         
-        if isinstance(self.content, (list, tuple)):
+        # Bare text is the common case, so test for it first
+        if type(self.content) is str:
+            content.append(self.content)
+        elif isinstance(self.content, (list, tuple)):
             content.extend(self.content)
         elif self.content is not None:
             content.append(self.content)
@@ -91,9 +105,10 @@ class Button(RegistryBase):
 
     def __ft__(self) -> Any:
         """Render the button component."""
+        variant_config = BUTTON_VARIANTS.get(self.var, _EMPTY_VARIANT)
         return FastButton(
-            *self.prepare_content(),
-            cls=self.get_classes(),
+            *self.prepare_content(variant_config),
+            cls=self.get_classes(variant_config),
             tabindex="0" if not self.disabled else "-1",
             aria_disabled="true" if self.disabled else None,
             type="button"
@@ -105,6 +120,9 @@ class Button(RegistryBase):
 
 ButtonVariant = ComponentVariant
 
+# Fallback for unknown variant names, shared rather than rebuilt per render
+_EMPTY_VARIANT = ButtonVariant("")
+
 # Built-in DaisyUI variants
 BUTTON_VARIANTS: Dict[str, ButtonVariant] = {
     # DaisyUI variants - implicit daisy=True
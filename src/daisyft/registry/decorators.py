@@ -2,7 +2,8 @@
 #  Component Registry and Metadata
 # ============================================================================
 from __future__ import annotations
-from typing import List, Optional, Type, TypeVar, Dict
+from importlib import import_module
+from typing import List, Optional, Tuple, Type, TypeVar, Dict
 from .base import (
     RegistryBase, 
     RegistryType, 
@@ -15,6 +16,17 @@ class Registry:
     """Component and block registry"""
     _components: Dict[str, Type[RegistryBase]] = {}
     _blocks: Dict[str, Type[RegistryBase]] = {}
+    _by_name: Dict[str, Type[RegistryBase]] = {}  # Lowercase name -> item, components first
+    _component_choices: Dict[str, str] = {}
+    _block_choices: Dict[str, str] = {}
+    _loaded: bool = False
+
+    @classmethod
+    def _ensure_loaded(cls) -> None:
+        """Import the bundled components on first lookup so they self-register"""
+        if not cls._loaded:
+            cls._loaded = True
+            import_module(".components", __package__)
 
     @classmethod
     def register(cls, type: RegistryType, **kwargs):
@@ -35,8 +47,14 @@ class Registry:
             )
             component_class._registry_meta = meta
             
-            registry = cls._blocks if type == RegistryType.BLOCK else cls._components
+            is_block = type == RegistryType.BLOCK
+            registry = cls._blocks if is_block else cls._components
             registry[name] = component_class
+            
+            # Precompute lookups and prompt choices once, at registration
+            choices = cls._block_choices if is_block else cls._component_choices
+            choices[name] = f"{meta.name}: {meta.description}"
+            cls._by_name[name.lower()] = cls._components.get(name) or cls._blocks.get(name)
             return component_class
         return decorator
 
@@ -53,37 +71,49 @@ class Registry:
     @classmethod
     def get_any(cls, name: str) -> Optional[Type[RegistryBase]]:
         """Get component or block by name"""
-        return cls._components.get(name) or cls._blocks.get(name)
+        cls._ensure_loaded()
+        return cls._by_name.get(name.lower())
 
     @classmethod
     def get_component(cls, name: str) -> Optional[Type[RegistryBase]]:
         """Get component by name"""
+        cls._ensure_loaded()
         return cls._components.get(name)
 
     @classmethod
     def get_block(cls, name: str) -> Optional[Type[RegistryBase]]:
         """Get block by name"""
+        cls._ensure_loaded()
         return cls._blocks.get(name)
 
     @classmethod
     def get_available_components(cls) -> List[str]:
         """Get list of available component descriptions"""
-        return [
-            f"{comp._registry_meta.name}: {comp._registry_meta.description}"
-            for comp in cls._components.values()
-        ]
+        cls._ensure_loaded()
+        return list(cls._component_choices.values())
 
     @classmethod
     def get_available_blocks(cls) -> List[str]:
         """Get list of available block descriptions"""
-        return [
-            f"{block._registry_meta.name}: {block._registry_meta.description}"
-            for block in cls._blocks.values()
-        ]
+        cls._ensure_loaded()
+        return list(cls._block_choices.values())
+
+    @classmethod
+    def get_component_choices(cls) -> List[Tuple[str, str]]:
+        """Get (label, name) pairs for component selection prompts"""
+        cls._ensure_loaded()
+        return [(label, name) for name, label in cls._component_choices.items()]
+
+    @classmethod
+    def get_block_choices(cls) -> List[Tuple[str, str]]:
+        """Get (label, name) pairs for block selection prompts"""
+        cls._ensure_loaded()
+        return [(label, name) for name, label in cls._block_choices.items()]
 
     @classmethod
     def get_by_category(cls, category: str) -> List[Type[RegistryBase]]:
         """Get all components and blocks in a category"""
+        cls._ensure_loaded()
         return [
             item for items in [cls._components.values(), cls._blocks.values()]
             for item in items 
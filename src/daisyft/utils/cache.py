@@ -0,0 +1,34 @@
+import os
+import sys
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+def user_cache_dir() -> Path:
+    """Per-user cache directory for daisyft (XDG_CACHE_HOME aware)"""
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+        elif sys.platform == "darwin":
+            base = Path.home() / "Library" / "Caches"
+        else:
+            base = Path.home() / ".cache"
+    return Path(base) / "daisyft"
+
+def read_json_cache(name: str) -> Optional[Any]:
+    """Load a cached JSON document, or None if missing or unreadable"""
+    path = user_cache_dir() / name
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+def write_json_cache(name: str, data: Any) -> None:
+    """Store a JSON document in the cache; failures are ignored"""
+    path = user_cache_dir() / name
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data))
+    except OSError:
+        pass
@@ -5,13 +5,20 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Literal, Optional
+from typing import Dict, List, Literal, Optional
 from platform import system, machine
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, lru_cache
 from .templates import render_template
+from .console import console
+import copy
+import os
 import typer
 
+# Host platform, looked up once per process
+_SYSTEM = system().lower()
+_MACHINE = machine().lower()
+
 @dataclass(frozen=True)
 class TailwindReleaseInfo:
     """Release information for Tailwind binaries"""
@@ -91,18 +98,34 @@ class ProjectConfig:
     @classmethod
     def load(cls, path: Path = Path("daisyft.conf.py")) -> "ProjectConfig":
         """Load config from a Python file"""
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return cls()  # Return defaults
-                    
-        from importlib.util import spec_from_file_location, module_from_spec
-        spec = spec_from_file_location("daisyft_conf", path)
-        module = module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return getattr(module, "config", cls())
+        return cls._load_stat(path, st)
+
+    @classmethod
+    def load_or_exit(cls, path: Path = Path("daisyft.conf.py")) -> "ProjectConfig":
+        """Load config, exiting with an error if not in a daisyft project"""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            console.print("[red]Error:[/red] Not in a daisyft project. Run 'daisyft init' first.")
+            raise typer.Exit(1)
+        return cls._load_stat(path, st)
+
+    @classmethod
+    def _load_stat(cls, path: Path, st: os.stat_result) -> "ProjectConfig":
+        """Load config for an already stat'ed file, reusing a cached parse if unchanged
+        
+        Each caller gets its own copy, so unsaved changes don't leak into later loads.
+        """
+        config = _load_cached(str(Path(path).resolve()), st.st_mtime_ns, st.st_size)
+        return copy.deepcopy(config) if config is not None else cls()
 
     def save(self, path: Path = Path("daisyft.conf.py")) -> None:
-        """Save config as a Python file using template"""
-        render_template(
+        """Save config as a Python file using template (no-op if unchanged)"""
+        written = render_template(
             "daisyft.conf.py.jinja2",
             path,
             style=self.style,
@@ -117,6 +140,9 @@ class ProjectConfig:
             verbose=self.verbose, 
             components=self.components
         )
+        # Don't trust mtime alone: a rewrite can land within the same timestamp tick
+        if written:
+            _load_cached.cache_clear()
 
     def update_binary_metadata(self, release_info: dict) -> None:
         """Update binary metadata from release info"""
@@ -126,8 +152,8 @@ class ProjectConfig:
     @cached_property
     def tailwind_binary_name(self) -> str:
         """Get the appropriate Tailwind binary name for the current system"""
-        os_name = system().lower()
-        arch = machine().lower()
+        os_name = _SYSTEM
+        arch = _MACHINE
         
         if os_name == "darwin":
             return f"tailwindcss-macos-{'arm64' if arch == 'arm64' else 'x64'}"
@@ -136,6 +162,49 @@ class ProjectConfig:
         else:
             return "tailwindcss-windows-x64.exe"
 
+    @cached_property
+    def tailwind_binary(self) -> Path:
+        """Absolute path of the project's Tailwind executable, resolved once"""
+        return Path("tailwindcss.exe" if _SYSTEM == "windows" else "tailwindcss").absolute()
+
+    @property
+    def ui_dir(self) -> Path:
+        """Directory for installed UI components"""
+        return self.paths["ui"]
+
+    @property
+    def css_dir(self) -> Path:
+        """Directory for Tailwind input/output CSS"""
+        return self.paths["css"]
+
+    @property
+    def input_css_path(self) -> Path:
+        """Tailwind input stylesheet"""
+        return self.css_dir / "input.css"
+
+    @property
+    def output_css_path(self) -> Path:
+        """Tailwind output stylesheet"""
+        return self.css_dir / "output.css"
+
+    def component_path(self, name: str) -> Path:
+        """Installed module path for a UI component"""
+        return self.paths["ui"] / f"{name}.py"
+
+    def ensure_directories(self, root: Path = Path(".")) -> List[Path]:
+        """Create the configured project directories under root
+        
+        Only leaf directories are created, since mkdir(parents=True) covers
+        their ancestors, and leaves that already exist cost a single stat.
+        Returns the leaf directories.
+        """
+        dirs = {root / path for path in self.paths.values()}
+        leaves = [d for d in dirs if not any(d in other.parents for other in dirs)]
+        for leaf in leaves:
+            if not leaf.is_dir():
+                leaf.mkdir(parents=True, exist_ok=True)
+        return leaves
+
     @property
     def is_initialized(self) -> bool:
         """Check if this is an initialized project"""
@@ -146,14 +215,15 @@ class ProjectConfig:
         if not self.is_initialized:
             raise typer.Exit("Not in a daisyft project. Run 'daisyft init' first.")
 
-    def add_component(self, name: str, type: str, path: Path) -> None:
+    def add_component(self, name: str, type: str, path: Path, save: bool = True) -> None:
         """Track an installed component"""
         self.components[name] = ComponentMetadata(
             name=name,
             type=type,
             path=path
         )
-        self.save()
+        if save:
+            self.save()
     
     def remove_component(self, name: str) -> None:
         """Remove a component from tracking"""
@@ -161,6 +231,11 @@ class ProjectConfig:
             del self.components[name]
             self.save()
     
+    @property
+    def installed_names(self) -> frozenset[str]:
+        """Snapshot of installed component names for batch membership checks"""
+        return frozenset(self.components)
+
     def has_component(self, name: str) -> bool:
         """Check if a component is installed"""
         return name in self.components
@@ -169,4 +244,13 @@ class ProjectConfig:
         """Get the installation path of a component"""
         if comp := self.components.get(name):
             return comp.path
-        return None 
\ No newline at end of file
+        return None 
+
+@lru_cache(maxsize=4)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Optional[ProjectConfig]:
+    """Execute a config file, cached on its path and stat signature"""
+    from importlib.util import spec_from_file_location, module_from_spec
+    spec = spec_from_file_location("daisyft_conf", path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, "config", None)
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from rich.console import Console
 from rich.theme import Theme
 
@@ -11,4 +12,25 @@ theme = Theme({
 })
 
 # Create shared console instance
-console = Console(theme=theme) 
\ No newline at end of file
+console = Console(theme=theme)
+
+class _NullProgress:
+    """Stand-in for rich Progress when there is no terminal to draw on"""
+    def add_task(self, description: str, **kwargs) -> int:
+        return 0
+    
+    def update(self, task_id: int, **kwargs) -> None:
+        pass
+
+def spinner(**kwargs):
+    """Spinner progress display, or a no-op one when output isn't a terminal"""
+    if not console.is_terminal:
+        return nullcontext(_NullProgress())
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        **kwargs
+    )
@@ -1,8 +1,10 @@
 import subprocess
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Iterable, Union
+from importlib import metadata
 import shutil
 import os
+import sys
 
 class PackageManager:
     """Handle different Python package managers"""
@@ -34,9 +36,30 @@ class PackageManager:
         return "pip"
     
     @staticmethod
-    def install_command(package: str, manager: Optional[str] = None) -> List[str]:
+    def missing(packages: Iterable[str]) -> List[str]:
+        """Filter packages down to those not installed in the project environment
+        
+        daisyft's own environment only says something about the project when
+        it is the active virtualenv; otherwise (e.g. a pipx install) every
+        package is reported and the package manager sorts it out.
+        """
+        venv = os.environ.get("VIRTUAL_ENV")
+        if not venv or Path(venv).resolve() != Path(sys.prefix).resolve():
+            return list(packages)
+        
+        result = []
+        for package in packages:
+            try:
+                metadata.distribution(package)
+            except (metadata.PackageNotFoundError, ValueError):
+                result.append(package)
+        return result
+    
+    @staticmethod
+    def install_command(package: Union[str, Iterable[str]], manager: Optional[str] = None) -> List[str]:
         """Get the appropriate install command for the package manager"""
         manager = manager or PackageManager.detect()
+        packages = [package] if isinstance(package, str) else list(package)
         
         commands = {
             "poetry": ["poetry", "add"],
@@ -45,10 +68,22 @@ class PackageManager:
             "pip": ["pip", "install"]
         }
         
-        return commands.get(manager, commands["pip"]) + [package]
+        return commands.get(manager, commands["pip"]) + packages
 
     @staticmethod
-    def install(package: str, manager: Optional[str] = None) -> subprocess.CompletedProcess:
-        """Install a package using the appropriate package manager"""
+    def install(
+        package: Union[str, Iterable[str]], 
+        manager: Optional[str] = None,
+        quiet: bool = True
+    ) -> subprocess.CompletedProcess:
+        """Install one or more packages in a single package manager call
+        
+        Quiet installs discard stdout and keep only stderr for error reporting;
+        otherwise output goes straight to the terminal.
+        """
         cmd = PackageManager.install_command(package, manager)
-        return subprocess.run(cmd, check=True, capture_output=True, text=True) 
\ No newline at end of file
+        if not quiet:
+            return subprocess.run(cmd, check=True)
+        return subprocess.run(
+            cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        ) 
\ No newline at end of file
@@ -3,10 +3,40 @@ import sys
 import subprocess
 import os
 import time
+import socket
+import selectors
+from pathlib import Path
 from rich.console import Console
 
 console = Console()
 
+def wait_for_file(path: Path, process: subprocess.Popen, timeout: float = 2.0) -> bool:
+    """Wait until a process has written path, giving up if it exits or times out"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists():
+            return True
+        if process.poll() is not None:
+            return False
+        time.sleep(0.02)
+    return path.exists()
+
+def wait_for_port(host: str, port: int, process: subprocess.Popen, timeout: float = 10.0) -> bool:
+    """Wait until host:port accepts connections, giving up if the process exits"""
+    # Wildcard binds are reachable on loopback
+    if host in ("0.0.0.0", "::", ""):
+        host = "127.0.0.1"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((host, port), timeout=0.05):
+                return True
+        except OSError:
+            time.sleep(0.02)
+    return False
+
 class ProcessManager:
     """Manage multiple subprocesses cleanly"""
     def __init__(self):
@@ -32,6 +62,57 @@ class ProcessManager:
     def add_process(self, process):
         """Add a process to manage"""
         self.processes.append(process)
+
+    def spawn(self, args, **kwargs) -> subprocess.Popen:
+        """Start a process in its own session (process group on Windows) and manage it
+
+        The new session lets cleanup() signal the process and its children
+        together with killpg.
+        """
+        if os.name == 'nt':
+            kwargs.setdefault("creationflags", subprocess.CREATE_NEW_PROCESS_GROUP)
+        else:
+            kwargs.setdefault("start_new_session", True)
+        process = subprocess.Popen(args, **kwargs)
+        self.add_process(process)
+        return process
+    
+    def wait_any(self) -> subprocess.Popen:
+        """Block until any managed process exits and return it"""
+        pidfds = self._open_pidfds()
+        if pidfds is None:
+            while True:
+                for process in self.processes:
+                    if process.poll() is not None:
+                        return process
+                time.sleep(0.1)
+        
+        # Linux: a pidfd becomes readable when its process exits
+        try:
+            with selectors.DefaultSelector() as selector:
+                for fd, process in pidfds:
+                    selector.register(fd, selectors.EVENT_READ, process)
+                while True:
+                    for key, _ in selector.select():
+                        if key.data.poll() is not None:
+                            return key.data
+        finally:
+            for fd, _ in pidfds:
+                os.close(fd)
+    
+    def _open_pidfds(self):
+        """Open a pidfd per process, or None if any can't be opened"""
+        if not hasattr(os, "pidfd_open"):
+            return None
+        pidfds = []
+        try:
+            for process in self.processes:
+                pidfds.append((os.pidfd_open(process.pid), process))
+        except OSError:  # Already reaped, or unsupported kernel
+            for fd, _ in pidfds:
+                os.close(fd)
+            return None
+        return pidfds
     
     def cleanup(self):
         """Clean up all processes"""
@@ -1,15 +1,85 @@
 from pathlib import Path
-from jinja2 import Environment, PackageLoader, select_autoescape
-
-env = Environment(
-    loader=PackageLoader("daisyft", "templates"),
-    autoescape=select_autoescape(["html", "xml"]),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-
-def render_template(template_name: str, output_path: Path, **kwargs) -> None:
-    """Render a template to a file"""
-    template = env.get_template(template_name)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(template.render(**kwargs)) 
\ No newline at end of file
+from functools import lru_cache
+from .cache import user_cache_dir
+
+def _bytecode_cache(name: str):
+    """Best-effort bytecode cache under the user cache dir
+    
+    Returns None if the directory can't be created. Reads and writes that
+    fail later (read-only dir, full disk) are skipped, so templates just
+    compile uncached instead of failing the render.
+    """
+    from jinja2 import FileSystemBytecodeCache
+    
+    class BestEffortBytecodeCache(FileSystemBytecodeCache):
+        def load_bytecode(self, bucket) -> None:
+            try:
+                super().load_bytecode(bucket)
+            except OSError:
+                pass
+        
+        def dump_bytecode(self, bucket) -> None:
+            try:
+                super().dump_bytecode(bucket)
+            except OSError:
+                pass
+    
+    cache_dir = user_cache_dir() / name
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return BestEffortBytecodeCache(str(cache_dir))
+
+@lru_cache(maxsize=1)
+def get_env():
+    """Shared Jinja environment, built on first render"""
+    from jinja2 import Environment, PackageLoader, select_autoescape
+    
+    # Compiled templates persist across runs
+    return Environment(
+        loader=PackageLoader("daisyft", "templates"),
+        autoescape=select_autoescape(["html", "xml"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,  # Packaged templates don't change under a running CLI
+        bytecode_cache=_bytecode_cache("jinja"),
+    )
+
+@lru_cache(maxsize=1)
+def get_component_env():
+    """Jinja environment for component sources
+    
+    Keeps Jinja's default whitespace handling, which the component template
+    is written against. Its bytecode lives apart from get_env()'s since the
+    same source compiles differently under the two settings.
+    """
+    from jinja2 import Environment, PackageLoader
+    
+    return Environment(
+        loader=PackageLoader("daisyft", "templates"),
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache("jinja-components"),
+    )
+
+def render_template(template_name: str, output_path: Path, **kwargs) -> bool:
+    """Render a template to a file, skipping the write if nothing changed
+    
+    New files are streamed straight to disk; existing ones are rendered in
+    full so they can be compared first. Returns True if the file was written.
+    """
+    template = get_env().get_template(template_name)
+    try:
+        existing = output_path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        existing = None  # Written in another encoding; replace it
+    except FileNotFoundError:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        template.stream(**kwargs).dump(str(output_path), encoding="utf-8")
+        return True
+    
+    content = template.render(**kwargs)
+    if existing == content:
+        return False
+    output_path.write_text(content, encoding="utf-8")
+    return True
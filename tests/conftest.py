@@ -0,0 +1,12 @@
+import pytest
+from daisyft.utils.templates import get_env, get_component_env
+
+@pytest.fixture(autouse=True)
+def isolated_user_cache(tmp_path, monkeypatch):
+    """Keep caches (Jinja bytecode, release info) out of the real user cache dir"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    get_env.cache_clear()
+    get_component_env.cache_clear()
+    yield
+    get_env.cache_clear()
+    get_component_env.cache_clear()
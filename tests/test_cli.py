@@ -1,4 +1,6 @@
 import pytest
+import os
+import sys
 from pathlib import Path
 from typer.testing import CliRunner
 from daisyft.cli.main import app
@@ -89,6 +91,28 @@ def test_registry_component_decorator():
     meta2 = TestButton2._registry_meta
     assert meta2.description == "Docstring description"
 
+def test_registry_class_body_keeps_decorators(temp_project, monkeypatch):
+    """Test the extracted class body keeps a decorated first statement intact"""
+    import importlib
+    
+    (temp_project / "decorated_component.py").write_text(
+        "from functools import lru_cache\n"
+        "from daisyft.registry.base import RegistryBase\n"
+        "\n"
+        "class Decorated(RegistryBase):\n"
+        "    # Cached helper\n"
+        "    @staticmethod\n"
+        "    @lru_cache\n"
+        "    def helper():\n"
+        "        return 1\n"
+    )
+    monkeypatch.syspath_prepend(str(temp_project))
+    module = importlib.import_module("decorated_component")
+    
+    assert module.Decorated.get_class_body() == (
+        "# Cached helper\n@staticmethod\n@lru_cache\ndef helper():\n    return 1\n"
+    )
+
 def test_registry_block_decorator():
     """Test Registry.block decorator"""
     @Registry.block(
@@ -113,7 +137,9 @@ def test_registry_component_lookup():
 
     assert Registry.get_component("lookup-test") == LookupTest
     assert Registry.get_any("lookup-test") == LookupTest
+    assert Registry.get_any("Lookup-Test") == LookupTest
     assert "lookup-test" in [c.split(":")[0].strip() for c in Registry.get_available_components()]
+    assert ("lookup-test: None", "lookup-test") in Registry.get_component_choices()
 
 # Config Tests
 def test_config_initialization(temp_project):
@@ -136,6 +162,60 @@ def test_config_save_load(temp_project):
     assert loaded_config.style == config.style
     assert loaded_config.paths == config.paths
 
+def test_config_save_unwritable_cache(temp_project):
+    """Test a bytecode cache that can't be written doesn't break rendering"""
+    from unittest.mock import patch
+    from jinja2 import FileSystemBytecodeCache
+    
+    with patch.object(FileSystemBytecodeCache, "dump_bytecode", side_effect=PermissionError):
+        ProjectConfig(style="vanilla").save(temp_project / "daisyft.conf.py")
+    
+    assert ProjectConfig.load(temp_project / "daisyft.conf.py").style == "vanilla"
+
+def test_config_save_replaces_non_utf8_file(temp_project):
+    """Test rendered files are compared and written as UTF-8"""
+    config_path = temp_project / "daisyft.conf.py"
+    config_path.write_bytes("# caf\u00e9\n".encode("latin-1"))
+    
+    ProjectConfig(style="vanilla").save(config_path)
+    assert "vanilla" in config_path.read_text(encoding="utf-8")
+
+def test_config_load_cached(temp_project):
+    """Test ProjectConfig.load reuses the parse until the file changes"""
+    from daisyft.utils.config import _load_cached
+    
+    config_path = temp_project / "daisyft.conf.py"
+    ProjectConfig(port=5001).save(config_path)
+    
+    first = ProjectConfig.load(config_path)
+    parses = _load_cached.cache_info().misses
+    second = ProjectConfig.load(config_path)
+    assert _load_cached.cache_info().misses == parses
+    
+    # Each load is a separate copy, so unsaved changes don't leak
+    assert second is not first
+    first.add_component("leaked", "component", temp_project / "leaked.py", save=False)
+    assert not ProjectConfig.load(config_path).has_component("leaked")
+    
+    # Saving identical content leaves the file (and the cached parse) alone
+    mtime = config_path.stat().st_mtime_ns
+    second.save(config_path)
+    assert config_path.stat().st_mtime_ns == mtime
+    ProjectConfig.load(config_path)
+    assert _load_cached.cache_info().misses == parses
+    
+    ProjectConfig(port=8000).save(config_path)
+    assert ProjectConfig.load(config_path).port == 8000
+
+def test_config_ensure_directories(temp_project):
+    """Test ProjectConfig creates only leaf directories"""
+    config = ProjectConfig()
+    leaves = config.ensure_directories(temp_project)
+    
+    assert temp_project / "components" not in leaves
+    assert temp_project / "components/ui" in leaves
+    assert all((temp_project / path).is_dir() for path in config.paths.values())
+
 def test_config_component_tracking(temp_project):
     """Test ProjectConfig component tracking"""
     config = ProjectConfig()
@@ -151,6 +231,36 @@ def test_config_component_tracking(temp_project):
     config.remove_component("test-component")
     assert not config.has_component("test-component")
 
+def test_install_plan_commit(mock_config, temp_project):
+    """Test InstallPlan writes files and tracks components in one pass"""
+    from daisyft.registry.base import InstallPlan
+
+    plan = InstallPlan()
+    target = temp_project / "components/ui/planned.py"
+    plan.py_writes[target] = "print('planned')\n"
+    plan.track(name="planned", type="component", path=target)
+    plan.commit(mock_config)
+
+    assert target.read_text() == "print('planned')\n"
+    assert mock_config.has_component("planned")
+
+    # Committing identical content leaves the file untouched
+    os.utime(target, ns=(0, 0))
+    plan.commit(mock_config)
+    assert target.stat().st_mtime_ns == 0
+
+def test_install_plan_unwritable_cache(mock_config):
+    """Test component rendering survives a bytecode cache that can't be written"""
+    from unittest.mock import patch
+    from jinja2 import FileSystemBytecodeCache
+    
+    button = Registry.get_component("button")
+    with patch.object(FileSystemBytecodeCache, "dump_bytecode", side_effect=OSError):
+        plan = button.plan_install(mock_config)
+    
+    content = plan.py_writes[mock_config.component_path("button")]
+    assert "class Button:" in content
+
 def test_config_binary_metadata():
     """Test ProjectConfig binary metadata handling"""
     config = ProjectConfig()
@@ -164,3 +274,155 @@ def test_config_binary_metadata():
     assert config.binary_metadata.version == "v1.0.0"
     assert config.binary_metadata.sha == "test-sha"
     assert config.binary_metadata.release_id == 123
+
+def test_registry_dependency_graph(monkeypatch):
+    """Test transitive dependency resolution for add"""
+    from daisyft.cli.add import _dependency_closure, _missing_packages
+
+    @Registry.component(name="graph-leaf")
+    class GraphLeaf:
+        pass
+
+    @Registry.component(name="graph-mid", dependencies=["graph-leaf", "pip:python-fasthtml"])
+    class GraphMid:
+        pass
+
+    @Registry.block(name="graph-root", dependencies=["graph-mid", "graph-leaf"])
+    class GraphRoot:
+        pass
+
+    classes = _dependency_closure(GraphRoot)
+    assert list(classes) == ["graph-mid", "graph-leaf"]
+    assert classes["graph-leaf"] is GraphLeaf
+
+    # pip: dependencies are batched, skipping packages installed in the active venv
+    GraphLeaf._registry_meta.dependencies.append("pip:not-a-real-package")
+    monkeypatch.setenv("VIRTUAL_ENV", sys.prefix)
+    assert _missing_packages(GraphRoot, classes) == ["not-a-real-package"]
+    
+    # Outside the project's venv nothing can be ruled out
+    monkeypatch.delenv("VIRTUAL_ENV")
+    assert _missing_packages(GraphRoot, classes) == ["python-fasthtml", "not-a-real-package"]
+    
+    # Unprefixed names must be registry items, never guessed to be packages
+    GraphLeaf._registry_meta.dependencies.append("grpah-mid")
+    with pytest.raises(ValueError, match="grpah-mid"):
+        _dependency_closure(GraphRoot)
+
+def test_install_dependencies_cycle(mock_config):
+    """Test components that depend on each other are each planned once"""
+    from daisyft.cli.add import _dependency_closure, _install_dependencies
+    from daisyft.registry.base import InstallPlan
+
+    planned = []
+    def plan_for(name):
+        @classmethod
+        def plan_install(cls, config, verbose=True):
+            planned.append(name)
+            return InstallPlan()
+        return plan_install
+
+    @Registry.component(name="cycle-a", dependencies=["cycle-b"])
+    class CycleA:
+        plan_install = plan_for("cycle-a")
+
+    @Registry.component(name="cycle-b", dependencies=["cycle-a"])
+    class CycleB:
+        plan_install = plan_for("cycle-b")
+
+    classes = _dependency_closure(CycleA)
+    assert list(classes) == ["cycle-b"]
+    _install_dependencies(classes, mock_config, force=True, verbose=False)
+    assert planned == ["cycle-b"]
+
+def test_add_import_hint_uses_registered_name(runner, temp_project, monkeypatch):
+    """Test the import hint names the installed module, whatever case was typed"""
+    from unittest.mock import Mock
+    
+    monkeypatch.chdir(temp_project)
+    monkeypatch.setattr("daisyft.utils.package.PackageManager.install", Mock())
+    ProjectConfig().save()
+    
+    result = runner.invoke(app, ["add", "Button"])
+    assert result.exit_code == 0
+    assert "from components.ui.button import Button" in result.output
+    assert (temp_project / "components/ui/button.py").exists()
+
+def test_css_stamp_tracks_sources(temp_project, monkeypatch):
+    """Test the run CSS stamp changes with sources but not with its output"""
+    from daisyft.cli.run import _css_stamp
+    
+    monkeypatch.chdir(temp_project)
+    output = temp_project / "static/css/output.css"
+    output.parent.mkdir(parents=True)
+    (temp_project / "main.py").write_text("app = None\n")
+    
+    stamp = _css_stamp(output)
+    output.write_text("built")
+    (temp_project / "__pycache__").mkdir()
+    (temp_project / "__pycache__/main.pyc").write_bytes(b"")
+    (temp_project / "myenv/lib").mkdir(parents=True)
+    (temp_project / "myenv/pyvenv.cfg").write_text("home = /usr/bin\n")
+    (temp_project / "myenv/lib/site.py").write_text("")
+    assert _css_stamp(output) == stamp
+    
+    (temp_project / "main.py").write_text("app = 'changed'\n")
+    assert _css_stamp(output) != stamp
+    
+    # Unreadable entries are skipped rather than aborting the walk
+    (temp_project / "dangling.py").symlink_to(temp_project / "missing.py")
+    assert _css_stamp(output)
+
+@pytest.fixture
+def process_manager(monkeypatch):
+    """ProcessManager that leaves pytest's signal handlers alone"""
+    from daisyft.utils.process import ProcessManager
+    
+    monkeypatch.setattr(ProcessManager, "_setup_signal_handlers", lambda self: None)
+    pm = ProcessManager()
+    yield pm
+    pm.cleanup()
+
+@pytest.mark.parametrize("pidfd", [True, False])
+def test_process_manager_wait_any(process_manager, monkeypatch, pidfd):
+    """Test wait_any returns the first process to exit, with and without pidfds"""
+    if not pidfd:
+        monkeypatch.setattr(process_manager, "_open_pidfds", lambda: None)
+    
+    slow = process_manager.spawn(["sleep", "5"])
+    fast = process_manager.spawn(["sleep", "0"])
+    
+    assert process_manager.wait_any() is fast
+    assert slow.poll() is None
+
+def test_wait_for_port(process_manager):
+    """Test wait_for_port sees a listening socket and times out on a closed port"""
+    import socket
+    from daisyft.utils.process import wait_for_port
+    
+    server = process_manager.spawn(["sleep", "5"])
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        port = sock.getsockname()[1]
+        assert wait_for_port("0.0.0.0", port, server, timeout=1.0)
+    
+    # Nothing listens once the socket is closed
+    assert not wait_for_port("127.0.0.1", port, server, timeout=0.2)
+    
+    # An exited server is given up on without waiting out the timeout
+    exited = process_manager.spawn(["sleep", "0"])
+    exited.wait()
+    assert not wait_for_port("127.0.0.1", port, exited, timeout=30.0)
+
+def test_wait_for_file(process_manager, temp_project):
+    """Test wait_for_file sees a written file and stops when the writer exits"""
+    from daisyft.utils.process import wait_for_file
+    
+    target = temp_project / "output.css"
+    writer = process_manager.spawn([sys.executable, "-c", f"open({str(target)!r}, 'w').close()"])
+    assert wait_for_file(target, writer)
+    
+    missing = temp_project / "never.css"
+    quitter = process_manager.spawn(["sleep", "0"])
+    assert not wait_for_file(missing, quitter, timeout=30.0)
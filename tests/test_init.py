@@ -12,6 +12,13 @@ from daisyft.cli.init import (
 )
 from daisyft.utils.config import ProjectConfig, TailwindReleaseInfo
 
+@pytest.fixture(autouse=True)
+def isolated_cache():
+    """Keep release lookups from leaking between tests"""
+    get_release_info.cache_clear()
+    yield
+    get_release_info.cache_clear()
+
 @pytest.fixture
 def mock_release_response():
     """Mock GitHub API response for releases"""
@@ -27,11 +34,13 @@ def mock_release_response():
 @pytest.fixture
 def mock_requests(mock_release_response):
     """Mock requests for GitHub API and binary download"""
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         # Mock API response
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {"ETag": '"v1"'}
         mock_get.return_value.json.return_value = mock_release_response
         # Mock binary download
-        mock_get.return_value.content = b"mock binary content"
+        mock_get.return_value.iter_content.return_value = [b"mock binary ", b"content"]
         mock_get.return_value.raise_for_status = lambda: None
         yield mock_get
 
@@ -57,12 +66,35 @@ def test_get_release_info(mock_requests):
     # Test DaisyUI style
     info = get_release_info("daisy")
     assert info["tag_name"] == "v1.0.0"
-    mock_requests.assert_called_with(TailwindReleaseInfo.get_api_url("daisy"))
+    mock_requests.assert_called_with(TailwindReleaseInfo.get_api_url("daisy"), headers={})
 
     # Test vanilla style
     info = get_release_info("vanilla")
     assert info["tag_name"] == "v1.0.0"
-    mock_requests.assert_called_with(TailwindReleaseInfo.get_api_url("vanilla"))
+    mock_requests.assert_called_with(TailwindReleaseInfo.get_api_url("vanilla"), headers={})
+
+def test_get_release_info_cached(mock_requests):
+    """Test release info is reused from memory and then from disk"""
+    get_release_info("daisy")
+    get_release_info("daisy")
+    assert mock_requests.call_count == 1
+    
+    # A new process (empty memory cache) reads the fresh disk copy
+    get_release_info.cache_clear()
+    assert get_release_info("daisy")["tag_name"] == "v1.0.0"
+    assert mock_requests.call_count == 1
+
+def test_get_release_info_revalidates(mock_requests, monkeypatch):
+    """Test a stale disk copy is revalidated and reused on 304"""
+    get_release_info("daisy")
+    get_release_info.cache_clear()
+    
+    monkeypatch.setattr("daisyft.cli.init.RELEASE_CACHE_TTL", 0)
+    mock_requests.return_value.status_code = 304
+    mock_requests.return_value.json.side_effect = AssertionError("body re-parsed")
+    
+    assert get_release_info("daisy")["tag_name"] == "v1.0.0"
+    assert mock_requests.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
 
 def test_download_tailwind_binary(tmp_path, mock_requests):
     """Test downloading Tailwind binary"""
@@ -71,12 +103,38 @@ def test_download_tailwind_binary(tmp_path, mock_requests):
     with patch('platform.system', return_value='Darwin'):
         binary_path = download_tailwind_binary(config)
         assert binary_path.exists()
+        assert binary_path.read_bytes() == b"mock binary content"
         assert binary_path.name == "tailwindcss"
         
         # Test binary metadata was updated
         assert config.binary_metadata is not None
         assert config.binary_metadata.version == "v1.0.0"
 
+def test_download_tailwind_binary_checksum(tmp_path, mock_requests, mock_release_response, monkeypatch):
+    """Test a download that doesn't match the published digest is discarded"""
+    monkeypatch.chdir(tmp_path)
+    config = ProjectConfig(style="daisy")
+    mock_release_response["assets"] = [
+        {"name": config.tailwind_binary_name, "digest": "sha256:" + "0" * 64}
+    ]
+    
+    with pytest.raises(RuntimeError, match="Checksum mismatch"):
+        download_tailwind_binary(config)
+    assert not (tmp_path / config.tailwind_binary_name).exists()
+    assert not (tmp_path / "tailwindcss").exists()
+
+def test_download_tailwind_binary_pinned_asset(tmp_path, mock_requests, mock_release_response, monkeypatch):
+    """Test the binary is fetched from the release the digest came from, not 'latest'"""
+    monkeypatch.chdir(tmp_path)
+    config = ProjectConfig(style="daisy")
+    asset_url = "https://example.com/v1.0.0/" + config.tailwind_binary_name
+    mock_release_response["assets"] = [
+        {"name": config.tailwind_binary_name, "browser_download_url": asset_url}
+    ]
+    
+    download_tailwind_binary(config)
+    mock_requests.assert_called_with(asset_url, stream=True)
+
 def test_init_options():
     """Test InitOptions dataclass"""
     options = InitOptions(
@@ -116,6 +174,48 @@ def test_get_user_options_defaults(mock_text, mock_confirm, mock_checkbox, mock_
     mock_confirm.assert_not_called()
     mock_text.assert_not_called()
 
+@patch('daisyft.cli.init._is_interactive', return_value=True)
+@patch('typer.confirm', return_value=False)
+@patch('questionary.prompt')
+@patch('questionary.checkbox')
+def test_get_user_options_prompt(mock_checkbox, mock_prompt, mock_use_defaults, mock_tty):
+    """Test selected options are collected in a single prompt session"""
+    mock_checkbox.return_value.ask.return_value = ["style", "theme", "app_path"]
+    mock_prompt.return_value = {"style": "vanilla", "app_path": "app.py"}
+    
+    options = get_user_options()
+    
+    questions = mock_prompt.call_args.args[0]
+    assert [q["name"] for q in questions] == ["style", "theme", "app_path"]
+    theme = questions[1]
+    assert not theme["when"]({"style": "vanilla"})
+    assert theme["when"]({"style": "daisy"})
+    
+    assert options.style == "vanilla"
+    assert options.theme == "dark"
+    assert options.app_path == Path("app.py")
+    assert options.static_dir == Path("static")
+
+@patch('daisyft.cli.init._is_interactive', return_value=True)
+@patch('typer.confirm', return_value=True)
+@patch('questionary.checkbox')
+def test_get_user_options_accept_defaults(mock_checkbox, mock_use_defaults, mock_tty):
+    """Test accepting the defaults skips the customization prompts"""
+    options = get_user_options()
+    
+    assert options == InitOptions()
+    mock_use_defaults.assert_called_once()
+    mock_checkbox.assert_not_called()
+
+@patch('questionary.checkbox')
+def test_get_user_options_non_interactive(mock_checkbox):
+    """Test defaults are used without prompting when stdin is not a TTY"""
+    with patch('daisyft.cli.init._is_interactive', return_value=False):
+        options = get_user_options()
+    
+    assert options == InitOptions()
+    mock_checkbox.assert_not_called()
+
 def test_init_command_defaults(runner, tmp_path, mock_requests, mock_templates, mock_package_manager):
     """Test init command with default options"""
     with runner.isolated_filesystem(temp_dir=tmp_path):
@@ -140,11 +240,35 @@ def test_init_command_defaults(runner, tmp_path, mock_requests, mock_templates,
         # Get the actual calls for debugging
         print(f"Template calls: {mock_templates.call_args_list}")
 
-@patch('daisyft.cli.init.questionary.select')
-@patch('daisyft.cli.init.questionary.checkbox')
-@patch('daisyft.cli.init.questionary.confirm')
-@patch('daisyft.cli.init.questionary.text')
-def test_init_command_interactive(mock_text, mock_confirm, mock_checkbox, mock_select, 
+def test_init_rerun_asks_before_spinner(runner, tmp_path, mock_requests, mock_templates, mock_package_manager):
+    """Test re-running init asks about an outdated binary on the main thread"""
+    import threading
+    from daisyft.utils.config import BinaryMetadata
+    
+    asked_from = []
+    def decline(*args, **kwargs):
+        asked_from.append(threading.current_thread())
+        return False
+    
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        ProjectConfig(
+            binary_metadata=BinaryMetadata.from_release_info({"tag_name": "v0.9.0"}, "daisy")
+        ).save()
+        Path("tailwindcss").write_bytes(b"old binary")
+        
+        with patch("typer.confirm", side_effect=decline):
+            result = runner.invoke(app, ["init"])
+        
+        assert result.exit_code == 0
+        assert asked_from == [threading.main_thread()]
+        assert Path("tailwindcss").read_bytes() == b"old binary"
+
+@patch('daisyft.cli.init._is_interactive', return_value=True)
+@patch('questionary.select')
+@patch('questionary.checkbox')
+@patch('questionary.confirm')
+@patch('questionary.text')
+def test_init_command_interactive(mock_text, mock_confirm, mock_checkbox, mock_select, mock_tty,
                                 runner, tmp_path, mock_requests, mock_templates, mock_package_manager):
     """Test init command in interactive mode"""
     # Mock the initial checkbox for options selection
@@ -170,7 +294,7 @@ def test_init_command_interactive(mock_text, mock_confirm, mock_checkbox, mock_s
         for dir_path in ["components/ui", "static/css", "static/js", "icons"]:
             (tmp_path / dir_path).mkdir(parents=True, exist_ok=True)
             
-        result = runner.invoke(app, ["init"])
+        result = runner.invoke(app, ["init"], input="n\n")
         print(f"Interactive command output: {result.output}")  # Debug output
         assert result.exit_code == 0
         
@@ -188,7 +312,7 @@ def test_init_command_interactive(mock_text, mock_confirm, mock_checkbox, mock_s
 def test_init_command_error_handling(runner, tmp_path):
     """Test init command error handling"""
     with runner.isolated_filesystem(temp_dir=tmp_path):
-        with patch('requests.get', side_effect=requests.RequestException("Network error")):
+        with patch('requests.Session.get', side_effect=requests.RequestException("Network error")):
             result = runner.invoke(app, ["init", "--defaults"])
             assert result.exit_code == 0  # Should continue despite error
             assert "Warning: Could not download Tailwind binary" in result.output 
\ No newline at end of file